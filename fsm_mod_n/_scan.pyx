@@ -0,0 +1,62 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Optional C implementation of the mod-N remainder scan.
+
+Built by setup.py when Cython is installed; fsm_mod_n.mod_n falls back to
+pure Python (or NumPy/Numba) when this extension is not available.
+"""
+
+cdef long long _reduce(const unsigned char[::1] data, const unsigned char[::1] lut,
+                       long long k, long long n, Py_ssize_t block, long long k_block) noexcept nogil:
+    cdef Py_ssize_t length = data.shape[0]
+    cdef Py_ssize_t head = length % block
+    cdef Py_ssize_t i, start
+    cdef long long r = 0
+    cdef long long v
+    cdef unsigned char d
+
+    for i in range(head):
+        d = lut[data[i]]
+        if d == 255:
+            return -1 - i
+        r = (r * k + d) % n
+
+    start = head
+    while start < length:
+        v = 0
+        for i in range(start, start + block):
+            d = lut[data[i]]
+            if d == 255:
+                return -1 - i
+            v = v * k + d
+        r = (r * k_block + v % n) % n
+        start += block
+    return r
+
+def scan(const unsigned char[::1] data, const unsigned char[::1] lut,
+         long long k, long long n, Py_ssize_t block, long long k_block):
+    """
+    Maps Latin-1 bytes to digits through `lut` and returns their base-k value modulo n.
+
+    Digits are combined exactly in blocks of `block` (k_block = k^block mod n)
+    so only one modulo is taken per block. The caller guarantees that
+    k^block and n * n fit in a signed 64-bit integer.
+
+    The loop touches no Python objects and runs without the GIL, so several
+    threads can scan different inputs in parallel.
+
+    Args:
+        data (bytes): The input string encoded as Latin-1.
+        lut (bytes): 256-byte table from byte to digit, 255 for invalid bytes.
+        k (int): Size of the alphabet (the numeric base).
+        n (int): The modulus value.
+        block (int): Number of digits combined per block.
+        k_block (int): k ** block modulo n.
+
+    Returns:
+        int: The remainder, or -1 - i if data[i] is not in the alphabet.
+    """
+    cdef long long r
+    with nogil:
+        r = _reduce(data, lut, k, n, block, k_block)
+    return r
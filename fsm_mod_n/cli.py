@@ -1,5 +1,5 @@
 import argparse
-from fsm_mod_n.mod_n import mod_n_remainder_custom_alphabet
+from fsm_mod_n.direct import compute_remainder_direct
 
 def main():
     # Set up argument parser for command-line inputs
@@ -21,8 +21,9 @@ def main():
     alphabet = set(args.alphabet.split(","))
 
     try:
-        # Call the FSM-based function to compute the remainder
-        remainder = mod_n_remainder_custom_alphabet(args.input_string, args.modulus, alphabet)
+        # Only the remainder is needed: use the direct path, which skips FSM
+        # construction and the import cost of logging and the accelerators
+        remainder = compute_remainder_direct(args.input_string, args.modulus, alphabet)
         
         # Output the result to the console
         print(f"Remainder of {args.input_string} mod {args.modulus} = {remainder}")
@@ -0,0 +1,39 @@
+from typing import Set
+
+# Lightweight remainder computation for one-shot callers such as the CLI.
+# Unlike fsm_mod_n.mod_n, importing this module does not pull in logging,
+# the FSM classes, or the optional NumPy/Numba/C accelerators.
+
+def compute_remainder_direct(input_string: str, n: int, alphabet: Set[str]) -> int:
+    """
+    Computes the remainder of a string-based number in a custom alphabet modulo n
+    with a plain Horner loop, r = (r * k + digit) % n.
+
+    Gives the same results and errors as mod_n_remainder_custom_alphabet, but
+    without building an FSM or loading any accelerator, so it is the cheapest
+    option for a single short input.
+
+    Args:
+        input_string (str): The input string to process.
+        n (int): The modulus value.
+        alphabet (Set[str]): The set of valid input symbols.
+
+    Returns:
+        int: The remainder of the number represented by the input string modulo n.
+    """
+    if n <= 0:
+        raise ValueError("Modulus must be positive.")
+    if not input_string:
+        raise ValueError("Input string cannot be empty.")
+
+    # Sorted alphabet position is the digit value, e.g. {'C', 'A', 'B'} → A=0, B=1, C=2
+    k = len(alphabet)
+    symbol_map = {symbol: idx for idx, symbol in enumerate(sorted(alphabet))}
+
+    remainder = 0
+    for ch in input_string:
+        digit = symbol_map.get(ch)
+        if digit is None:
+            raise ValueError(f"Invalid character {ch!r} in input string. Valid alphabet: {alphabet}")
+        remainder = (remainder * k + digit) % n
+    return remainder
@@ -1,14 +1,72 @@
 import logging
-from typing import Any, Dict, Set
-
-# Configure logging to write messages to 'fsm.log' with time, level, and message.
-logging.basicConfig(
-    filename='fsm.log',
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+import logging.handlers
+from typing import Any, Dict, List, Optional, Sequence, Set
+
 logger = logging.getLogger(__name__)
 
+# Lookup-table entry for bytes that are not symbols of the alphabet
+_INVALID_SYMBOL = 255
+
+# Number of records buffered in memory before they are written to the log file
+_LOG_BUFFER_CAPACITY = 4096
+
+# Buffering handlers installed by enable_file_logging, flushed after each FSM.process
+_buffered_handlers: List[logging.handlers.MemoryHandler] = []
+
+def enable_file_logging(path: str = 'fsm.log', level: int = logging.INFO) -> logging.Handler:
+    """
+    Opt-in logging of fsm_mod_n messages to a file, with time, level, and message.
+
+    Importing the library never touches the filesystem; only this call
+    attaches a handler, to the 'fsm_mod_n' package logger. The logger's own
+    level and propagation are left to the application: records below the
+    logger's effective level (WARNING by default) never reach the file, e.g.
+    call logging.getLogger('fsm_mod_n').setLevel(logging.INFO) to record
+    FSM activity. Per-transition messages are only emitted at DEBUG level.
+
+    Records are buffered in memory and written in batches: when the buffer
+    holds _LOG_BUFFER_CAPACITY records, on an ERROR, and at the end of every
+    FSM.process call, instead of one write() per record.
+
+    Args:
+        path (str): Log file path, opened on the first record.
+        level (int): Minimum logging level to record.
+
+    Returns:
+        logging.Handler: The attached handler; pass it to disable_file_logging to stop logging.
+    """
+    file_handler = logging.FileHandler(path, delay=True)
+    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    handler = logging.handlers.MemoryHandler(
+        _LOG_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=file_handler
+    )
+    handler.setLevel(level)
+    logging.getLogger('fsm_mod_n').addHandler(handler)
+    _buffered_handlers.append(handler)
+    return handler
+
+def disable_file_logging(handler: logging.Handler):
+    """
+    Detaches a handler returned by enable_file_logging, writing out any
+    buffered records and closing the log file.
+
+    Args:
+        handler (logging.Handler): The handler to remove.
+    """
+    logging.getLogger('fsm_mod_n').removeHandler(handler)
+    if handler in _buffered_handlers:
+        _buffered_handlers.remove(handler)
+
+    target = getattr(handler, 'target', None)
+    handler.close()  # Flushes the buffer into the target
+    if target is not None:
+        target.close()
+
+def _flush_log_buffers():
+    """Writes out records buffered by enable_file_logging handlers."""
+    for handler in _buffered_handlers:
+        handler.flush()
+
 class FSM:
     """
     A generic Finite State Machine (FSM) implementation.
@@ -46,7 +104,16 @@ class FSM:
         self.transition_function = transition_function
         self.current_state = initial_state
 
-        logger.info(f"FSM initialized with states={states}, alphabet={alphabet}, initial_state={initial_state}")
+        if logger.isEnabledFor(logging.INFO):
+            # The state count rather than the whole set, which can be huge for large n
+            logger.info(
+                f"FSM initialized with {len(states)} states, alphabet={alphabet}, "
+                f"initial_state={self._state_name(initial_state)}"
+            )
+
+    def _state_name(self, state: Any) -> str:
+        """Renders a state for log messages."""
+        return str(state)
 
     def reset(self):
         """
@@ -71,7 +138,8 @@ class FSM:
 
         # Retrieve the next state from the transition function
         next_state = self.transition_function[self.current_state][symbol]
-        logger.info(f"Transition: ({self.current_state}, '{symbol}') -> {next_state}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Transition: ({self.current_state}, '{symbol}') -> {next_state}")
         self.current_state = next_state
 
     def process(self, input_sequence: str) -> Any:
@@ -85,14 +153,180 @@ class FSM:
             Any: The final state after processing the sequence.
         """
         self.reset()
-        logger.info(f"Processing input: {input_sequence}")
+        log_info = logger.isEnabledFor(logging.INFO)
+        if log_info:
+            logger.info(f"Processing input: {input_sequence}")
         
         for symbol in input_sequence:
             self.transition(symbol)
         
-        logger.info(f"Final state: {self.current_state}")
+        if log_info:
+            logger.info(f"Final state: {self.current_state}")
+        if _buffered_handlers:
+            _flush_log_buffers()
         return self.current_state
     
     def is_accepting(self) -> bool:
         """Returns True if the current state is a final (accepting) state."""
         return self.current_state in self.final_states
+
+class TableFSM(FSM):
+    """
+    An FSM over integer states 0..n-1 whose transitions are stored in a flat
+    table instead of nested dicts.
+
+    Symbols are indexed by their position in the sorted alphabet, and the
+    next state for (state, symbol) is found at transition_function[state * k + index].
+
+    Attributes:
+        transition_function (Sequence[int]): Flat table of n * k next states.
+        k (int): Number of input symbols.
+        sym_idx (Dict[Any, int]): Index of each symbol in the sorted alphabet
+            (computed unless passed to the constructor).
+        lut (Optional[bytes]): 256-byte table from Latin-1 byte to symbol index
+            matching sym_idx (computed unless passed to the constructor).
+    """
+
+    def __init__(
+        self,
+        states: Set[int],
+        alphabet: Set[Any],
+        initial_state: int,
+        final_states: Set[int],
+        transition_function: Sequence[int],
+        sym_idx: Optional[Dict[Any, int]] = None,
+        lut: Optional[bytes] = None
+    ):
+        super().__init__(states, alphabet, initial_state, final_states, transition_function)
+
+        # Validate that the table has one entry per (state, symbol) pair
+        if len(transition_function) != len(states) * len(alphabet):
+            raise ValueError("Transition table must have one entry per state and symbol.")
+
+        # A precomputed symbol index (e.g. shared by FSMs over the same alphabet) skips the sort
+        if sym_idx is None:
+            sym_idx = {symbol: idx for idx, symbol in enumerate(sorted(alphabet))}
+
+        # Likewise a shared lookup table skips rebuilding it; it must match sym_idx
+        if lut is None:
+            lut = _byte_lookup_table(sym_idx)
+
+        self.k = len(alphabet)
+        self.sym_idx = sym_idx
+        self._sym_to_idx = lut
+
+    def _state_name(self, state: int) -> str:
+        """Renders an integer state in the 'S<i>' form used by the generic FSM."""
+        return f"S{state}"
+
+    @property
+    def current_state_name(self) -> str:
+        """Name of the current state in the 'S<i>' form used by the generic FSM."""
+        return self._state_name(self.current_state)
+
+    def transition(self, symbol: Any):
+        """
+        Performs a state transition with a single flat-table lookup.
+
+        Args:
+            symbol (Any): The input symbol.
+
+        Raises:
+            ValueError: If the symbol is not in the FSM's alphabet.
+        """
+        idx = self.sym_idx.get(symbol)
+        if idx is None:
+            logger.error(f"Symbol '{symbol}' not in alphabet {self.alphabet}")
+            raise ValueError(f"Invalid symbol: {symbol}")
+
+        next_state = self.transition_function[self.current_state * self.k + idx]
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Transition: (S{self.current_state}, '{symbol}') -> S{next_state}")
+        self.current_state = next_state
+
+    def process(self, input_sequence: str) -> int:
+        """
+        Processes a sequence of input symbols through the FSM.
+
+        For alphabets of single Latin-1 characters the whole input is mapped
+        to symbol indices in one bytes.translate call through a 256-byte
+        lookup table, replacing the per-symbol alphabet check. DEBUG tracing
+        of individual transitions uses the symbol-by-symbol path.
+
+        Args:
+            input_sequence (str): Sequence of input symbols.
+
+        Returns:
+            int: The final state after processing the sequence.
+        """
+        self.reset()
+        log_info = logger.isEnabledFor(logging.INFO)
+        if log_info:
+            logger.info(f"Processing input: {input_sequence}")
+
+        lut = self._sym_to_idx
+        if lut is None or not isinstance(input_sequence, str) or logger.isEnabledFor(logging.DEBUG):
+            for symbol in input_sequence:
+                self.transition(symbol)
+        else:
+            self.current_state = self._process_indexed(input_sequence, lut)
+
+        # States are plain ints; the 'S<i>' name is only built for the log
+        if log_info:
+            logger.info(f"Final state: {self.current_state_name}")
+        if _buffered_handlers:
+            _flush_log_buffers()
+        return self.current_state
+
+    def _process_indexed(self, input_sequence: str, lut: bytes) -> int:
+        """
+        Runs the input through the flat table after mapping it to symbol indices.
+
+        Args:
+            input_sequence (str): Sequence of input symbols.
+            lut (bytes): 256-byte symbol index table from _byte_lookup_table.
+
+        Returns:
+            int: The final state after processing the sequence.
+
+        Raises:
+            ValueError: If a symbol is not in the FSM's alphabet.
+        """
+        try:
+            indices = input_sequence.encode('latin-1').translate(lut)
+            bad_pos = indices.find(_INVALID_SYMBOL)
+        except UnicodeEncodeError as e:
+            bad_pos = e.start
+        if bad_pos >= 0:
+            symbol = input_sequence[bad_pos]
+            logger.error(f"Symbol '{symbol}' not in alphabet {self.alphabet}")
+            raise ValueError(f"Invalid symbol: {symbol}")
+
+        table = self.transition_function
+        k = self.k
+        state = self.current_state
+        for idx in indices:
+            state = table[state * k + idx]
+        return state
+
+def _byte_lookup_table(sym_idx: Dict[Any, int]) -> Optional[bytes]:
+    """
+    Builds a 256-byte table mapping each Latin-1 byte to its symbol index,
+    with _INVALID_SYMBOL for bytes outside the alphabet.
+
+    Args:
+        sym_idx (Dict[Any, int]): Index of each symbol in the sorted alphabet.
+
+    Returns:
+        Optional[bytes]: The table, or None if the alphabet has a symbol that
+        is not a single Latin-1 character or has too many symbols to index in a byte.
+    """
+    if len(sym_idx) > _INVALID_SYMBOL:
+        return None
+
+    lut = bytearray([_INVALID_SYMBOL]) * 256
+    for symbol, idx in sym_idx.items():
+        if not isinstance(symbol, str) or len(symbol) != 1 or ord(symbol) > 255:
+            return None
+        lut[ord(symbol)] = idx
+    return bytes(lut)
@@ -1,11 +1,74 @@
+import array
+import functools
 import logging
-from typing import Dict, Set
-from fsm_mod_n.fsm import FSM  # Importing the generic FSM class
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple
+from fsm_mod_n.fsm import TableFSM  # Flat-table specialization of the generic FSM
+from fsm_mod_n.fsm import _INVALID_SYMBOL, _byte_lookup_table  # Shared symbol lookup table
+
+try:  # C extension built from _scan.pyx when Cython is available at install time
+    from fsm_mod_n._scan import scan as _c_scan
+except ImportError:
+    _c_scan = None
+
+# NumPy and Numba only serve inputs the C scan would otherwise handle, so
+# they are not imported (Numba alone costs ~200 ms) when the extension is built.
+np = None
+njit = None
+if _c_scan is None:
+    try:  # NumPy is optional; it only speeds up long inputs
+        import numpy as np
+    except ImportError:
+        pass
+
+    try:  # Numba is optional; it compiles the long-input scan to machine code
+        from numba import njit
+    except ImportError:
+        pass
 
 # Set up logger for this module
 logger = logging.getLogger(__name__)
 
-def build_mod_n_fsm(n: int, alphabet: Set[str]) -> FSM:
+# Inputs at least this long are evaluated with NumPy when it is available
+_NUMPY_MIN_LENGTH = 512
+
+# Largest modulus for which the compiled and NumPy paths cannot overflow int64 products
+_FAST_MAX_MODULUS = 2 ** 31
+
+# Batches with at least this many symbols in total are scanned in a thread pool
+_PARALLEL_MIN_LENGTH = 1 << 16
+
+# Largest modulus for which the pure-Python scan tabulates (r * k) % n
+_MULTIPLY_TABLE_MAX_MODULUS = 1 << 16
+
+# Upper bound on the number of digits the fast paths combine into one block
+_MAX_BLOCK_SIZE = 32
+
+# Transition tables with at most this many entries (n * k) are cached between builds
+_TABLE_CACHE_MAX_ENTRIES = 1 << 20
+
+if njit is not None:
+    @njit(cache=True)
+    def _jit_scan(digits, k, n, block, k_block):
+        """
+        Horner scan over an array of digit values, JIT-compiled by Numba.
+        Digits are combined exactly in blocks of `block` (k_block = k^block mod n)
+        so only one modulo is taken per block.
+        """
+        r = 0
+        head = digits.shape[0] % block
+        for i in range(head):
+            r = (r * k + digits[i]) % n
+        for start in range(head, digits.shape[0], block):
+            v = 0
+            for i in range(start, start + block):
+                v = v * k + digits[i]
+            r = (r * k_block + v % n) % n
+        return r
+else:
+    _jit_scan = None
+
+def build_mod_n_fsm(n: int, alphabet: Set[str]) -> TableFSM:
     """
     Constructs a finite state machine (FSM) that computes the remainder
     of a number (represented using a given alphabet) modulo n.
@@ -13,74 +76,317 @@ def build_mod_n_fsm(n: int, alphabet: Set[str]) -> FSM:
     Alphabet is sorted and each symbol is assigned a digit:
     Example: {'C', 'A', 'B'} → A=0, B=1, C=2.
 
+    States are the remainders 0..n-1 themselves, and transitions are stored
+    flat, so state i on digit v moves to transition_function[i * k + v].
+
+    Transition tables of up to _TABLE_CACHE_MAX_ENTRIES entries are cached
+    per (n, alphabet), so repeated builds only allocate a fresh FSM around
+    the shared table; larger tables are rebuilt and freed with their FSM.
+
     Args:
         n (int): The modulus value.
         alphabet (Set[str]): Set of valid input symbols.
 
     Returns:
-        FSM: A configured FSM capable of computing mod-n remainder.
+        TableFSM: A configured FSM capable of computing mod-n remainder.
     """
     if n <= 0:
         raise ValueError("Modulus must be positive.")
     if not alphabet:
         raise ValueError("Alphabet must not be empty.")
 
-    logger.info(f"Building FSM for mod {n} with alphabet {alphabet}")
+    key = frozenset(alphabet)
+    if n * len(key) <= _TABLE_CACHE_MAX_ENTRIES:
+        transition_function = _cached_transition_table(n, key)
+    else:
+        transition_function = _build_transition_table(n, key)
 
-    # Create a state for each possible remainder value: S0 to S(n-1)
-    states = {f"S{i}" for i in range(n)}
-    initial_state = 'S0'  # Start at remainder 0
+    # Each caller gets its own FSM (current_state is mutable); only the table is shared
+    states = frozenset(range(n))  # Create a state for each possible remainder value: 0 to n-1
+    initial_state = 0  # Start at remainder 0
     final_states = states  # All states are considered valid final states
+    symbol_map, lut = _alphabet_tables(key)
+    return TableFSM(states, alphabet, initial_state, final_states, transition_function, symbol_map, lut)
+
+@functools.lru_cache(maxsize=32)
+def _cached_transition_table(n: int, alphabet: FrozenSet[str]) -> Sequence[int]:
+    """Builds (once per n and alphabet) the table returned by _build_transition_table."""
+    return _build_transition_table(n, alphabet)
+
+def _build_transition_table(n: int, alphabet: FrozenSet[str]) -> Sequence[int]:
+    """
+    Builds the flat transition table of the mod-n FSM.
+
+    When every state fits in a byte (n <= 256) the table is an immutable
+    bytes object of n * k entries; otherwise it is an array.array of ints.
+
+    Args:
+        n (int): The modulus value.
+        alphabet (FrozenSet[str]): Set of valid input symbols.
+
+    Returns:
+        Sequence[int]: The transition table. It may be shared between cached
+        FSMs and must not be mutated.
+    """
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"Building FSM for mod {n} with alphabet {set(alphabet)}")
+
+    # Symbol at sorted position v is digit v, so row i holds (i * k + v) % n
+    k = len(alphabet)
+    next_states = [(i * k + v) % n for i in range(n) for v in range(k)]
+    if n <= 256:
+        transition_function: Sequence[int] = bytes(next_states)
+    else:
+        transition_function = array.array('i' if n <= 2 ** 31 else 'q', next_states)
+    return transition_function
+
+def _remainder_numpy(digits: bytes, n: int, k: int) -> int:
+    """
+    Evaluates the digit values with NumPy instead of stepping through them per symbol.
+    Digits are grouped into blocks of B whose base-k value is computed
+    exactly, and the blocks are combined as digits in base k^B (mod n),
+    shrinking the modular work by a factor of B. The blocks are combined by
+    the Numba-compiled scan when available, otherwise by a vectorized Horner
+    evaluation.
+
+    Args:
+        digits (bytes): Digit value of each input symbol.
+        n (int): The modulus value.
+        k (int): Size of the alphabet (the numeric base).
 
-    transition_function: Dict[str, Dict[str, str]] = {}
+    Returns:
+        int: The remainder of the number represented by the digits modulo n.
+    """
+    vals = np.frombuffer(digits, dtype=np.uint8)
+    block = _block_size(k)
 
-    # Sort the alphabet to ensure consistent indexing
-    sorted_alphabet = sorted(alphabet)
+    if _jit_scan is not None:
+        return int(_jit_scan(vals, k, n, block, pow(k, block, n)))
 
-    # Map each symbol in the alphabet to a unique integer value
-    symbol_map = {symbol: idx for idx, symbol in enumerate(sorted_alphabet)}
+    # Left-pad with zero digits (which do not change the value) and split into
+    # blocks of B digits, each evaluated exactly in int64 as a base-k number
+    pad = -len(vals) % block
+    if pad:
+        vals = np.concatenate((np.zeros(pad, dtype=np.uint8), vals))
+    place_values = np.array([k ** j for j in range(block - 1, -1, -1)], dtype=np.int64)
+    block_vals = vals.reshape(-1, block).astype(np.int64) @ place_values % n
 
-    # Build the transition table
-    for i in range(n):  # For each state
-        transitions = {}
-        for symbol in alphabet:
-            val = symbol_map[symbol]
-            # Compute next state based on current state and input symbol
-            next_state = (i * len(alphabet) + val) % n
-            transitions[symbol] = f'S{next_state}'
-        transition_function[f'S{i}'] = transitions
+    # The blocks are digits in base k^B: powers[j] = (k^B) ** j mod n, built by
+    # repeatedly doubling the known prefix
+    k_block = pow(k, block, n)
+    powers = np.ones(1, dtype=np.int64)
+    while len(powers) < len(block_vals):
+        step = pow(k_block, len(powers), n)
+        powers = np.concatenate((powers, powers * step % n))
 
-    # Return an FSM instance with all required components
-    return FSM(states, alphabet, initial_state, final_states, transition_function)
+    # The last block is the least significant one
+    weights = powers[len(block_vals) - 1::-1]
+
+    terms = block_vals * weights % n
+    return int(terms.sum()) % n
+
+def _block_size(k: int) -> int:
+    """
+    Returns the number of base-k digits whose value always fits in int64,
+    capped at _MAX_BLOCK_SIZE.
+
+    Args:
+        k (int): Size of the alphabet (the numeric base).
+
+    Returns:
+        int: The block size B, with k ** B <= 2 ** 62.
+    """
+    block = 1
+    while block < _MAX_BLOCK_SIZE and k ** (block + 1) <= 2 ** 62:
+        block += 1
+    return block
 
 def mod_n_remainder_custom_alphabet(input_string: str, n: int, alphabet: Set[str]) -> int:
     """
-    Uses a finite state machine to compute the remainder of a string-based number
-    in a custom alphabet modulo n.
+    Computes the remainder of a string-based number in a custom alphabet modulo n.
+
+    The result equals the final state of the FSM from build_mod_n_fsm, but the
+    FSM is never built: each symbol applies the same transition arithmetically,
+    r = (r * k + digit) % n, so no O(n * k) transition table is allocated.
 
     Args:
         input_string (str): The input string to process.
         n (int): The modulus value.
         alphabet (Set[str]): The set of valid input symbols.
 
+    Returns:
+        int: The remainder of the number represented by the input string modulo n.
+    """
+    if n <= 0:
+        raise ValueError("Modulus must be positive.")
+
+    symbol_map, lut = _symbol_tables(alphabet)
+    return _remainder(input_string, n, alphabet, symbol_map, lut)
+
+def mod_n_remainder_batch(
+    input_strings: Iterable[str],
+    n: int,
+    alphabet: Set[str],
+    max_workers: Optional[int] = None
+) -> List[int]:
+    """
+    Computes the remainders of many strings against the same modulus and alphabet.
+
+    The symbol lookup tables are built once for the whole batch. When the C
+    scan extension is available it runs without the GIL, so large batches are
+    spread over a thread pool.
+
+    Args:
+        input_strings (Iterable[str]): The input strings to process.
+        n (int): The modulus value.
+        alphabet (Set[str]): The set of valid input symbols.
+        max_workers (Optional[int]): Thread pool size (ThreadPoolExecutor default if None).
+
+    Returns:
+        List[int]: The remainder of each input string modulo n, in input order.
+    """
+    if n <= 0:
+        raise ValueError("Modulus must be positive.")
+
+    input_strings = list(input_strings)
+    symbol_map, lut = _symbol_tables(alphabet)
+    compute = functools.partial(_remainder, n=n, alphabet=alphabet, symbol_map=symbol_map, lut=lut)
+
+    parallel = (
+        _c_scan is not None and lut is not None and n <= _FAST_MAX_MODULUS
+        and len(input_strings) > 1
+        and sum(map(len, input_strings)) >= _PARALLEL_MIN_LENGTH
+    )
+    if not parallel:
+        return [compute(input_string) for input_string in input_strings]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(compute, input_strings))
+
+def _symbol_tables(alphabet: Set[str]) -> Tuple[Dict[str, int], Optional[bytes]]:
+    """
+    Maps each symbol to its digit value in the sorted alphabet.
+
+    Args:
+        alphabet (Set[str]): The set of valid input symbols.
+
+    Returns:
+        Tuple[Dict[str, int], Optional[bytes]]: The symbol-to-digit map and the
+        matching 256-byte lookup table (None unless all symbols are single
+        Latin-1 characters). Both are cached per alphabet and must not be mutated.
+    """
+    return _alphabet_tables(frozenset(alphabet))
+
+@functools.lru_cache(maxsize=128)
+def _alphabet_tables(alphabet: FrozenSet[str]) -> Tuple[Dict[str, int], Optional[bytes]]:
+    """Builds (once per alphabet) the tables returned by _symbol_tables."""
+    symbol_map = {symbol: idx for idx, symbol in enumerate(sorted(alphabet))}
+    return symbol_map, _byte_lookup_table(symbol_map)
+
+def _remainder(
+    input_string: str,
+    n: int,
+    alphabet: Set[str],
+    symbol_map: Dict[str, int],
+    lut: Optional[bytes]
+) -> int:
+    """
+    Computes the remainder of one input string using prebuilt symbol tables.
+
+    Args:
+        input_string (str): The input string to process.
+        n (int): The modulus value (already validated as positive).
+        alphabet (Set[str]): The set of valid input symbols.
+        symbol_map (Dict[str, int]): Digit value of each symbol, from _symbol_tables.
+        lut (Optional[bytes]): Byte lookup table, from _symbol_tables.
+
     Returns:
         int: The remainder of the number represented by the input string modulo n.
     """
     if not input_string:
         raise ValueError("Input string cannot be empty.")
 
-    # Ensure every character in the input is valid
-    if any(ch not in alphabet for ch in input_string):
-        raise ValueError(f"Invalid character in input string. Valid alphabet: {alphabet}")
+    k = len(alphabet)
+
+    # Every number is 0 mod 1, and a one-symbol alphabet can only spell 0, so
+    # in these cases the input just has to be validated
+    always_zero = n == 1 or k == 1
+
+    # Invalid characters are detected while mapping symbols to digits, so the
+    # input is only traversed once
+    if lut is None:
+        if always_zero:
+            invalid = set(input_string).difference(symbol_map)
+            if invalid:
+                raise _invalid_character(next(ch for ch in input_string if ch in invalid), alphabet)
+            return 0
 
-    # Build the FSM for the given alphabet and modulus
-    fsm = build_mod_n_fsm(n, alphabet)
+        # Multi-character or non-Latin-1 symbols: map characters through a dict
+        remainder = 0
+        try:
+            for ch in input_string:
+                remainder = (remainder * k + symbol_map[ch]) % n
+        except KeyError:
+            raise _invalid_character(ch, alphabet) from None
+        return remainder
 
-    # Process the input string through the FSM
-    final_state = fsm.process(input_string)
+    try:
+        data = input_string.encode('latin-1')
+    except UnicodeEncodeError as e:
+        raise _invalid_character(input_string[e.start], alphabet) from None
 
-    # Extract the numeric remainder from the final state name (e.g., 'S2' -> 2)
-    return int(final_state[1:])
+    if _c_scan is not None and n <= _FAST_MAX_MODULUS and not always_zero:
+        # The compiled scan maps, validates and reduces in a single C loop
+        block = _block_size(k)
+        remainder = _c_scan(data, lut, k, n, block, pow(k, block, n))
+        if remainder < 0:
+            raise _invalid_character(input_string[-1 - remainder], alphabet)
+        return remainder
+
+    # Map every symbol to its digit value in a single C-level translate call
+    digits = data.translate(lut)
+    bad_pos = digits.find(_INVALID_SYMBOL)
+    if bad_pos >= 0:
+        raise _invalid_character(input_string[bad_pos], alphabet)
+
+    if always_zero:
+        return 0
+
+    if np is not None and len(digits) >= _NUMPY_MIN_LENGTH and n <= _FAST_MAX_MODULUS:
+        return _remainder_numpy(digits, n, k)
+
+    # Single tight loop over the digit values, bypassing FSM construction
+    remainder = 0
+    if k <= n <= _MULTIPLY_TABLE_MAX_MODULUS:
+        # mul_k[r] + v < 2n, so one conditional subtraction replaces the modulo
+        mul_k = _multiply_table(n, k)
+        for v in digits:
+            remainder = mul_k[remainder] + v
+            if remainder >= n:
+                remainder -= n
+        return remainder
+
+    for v in digits:
+        remainder = (remainder * k + v) % n
+    return remainder
+
+@functools.lru_cache(maxsize=128)
+def _multiply_table(n: int, k: int) -> List[int]:
+    """
+    Tabulates (r * k) % n for every remainder r, for the pure-Python scan.
+
+    Args:
+        n (int): The modulus value.
+        k (int): Size of the alphabet (the numeric base).
+
+    Returns:
+        List[int]: mul_k with mul_k[r] == (r * k) % n. Shared between calls; must not be mutated.
+    """
+    return [(r * k) % n for r in range(n)]
+
+def _invalid_character(ch: str, alphabet: Set[str]) -> ValueError:
+    """Builds the error raised for an input character outside the alphabet."""
+    return ValueError(f"Invalid character {ch!r} in input string. Valid alphabet: {alphabet}")
 
 def mod_n_remainder(binary_string: str, n: int) -> int:
     """
@@ -95,9 +401,35 @@ def mod_n_remainder(binary_string: str, n: int) -> int:
     """
     return mod_n_remainder_custom_alphabet(binary_string, n, {'0', '1'})
 
+def mod_n_compute(input_string: str, n: int, alphabet: Set[str]) -> Tuple[int, bool]:
+    """
+    Computes the remainder and whether the mod-n FSM accepts the input, in one pass.
+
+    The input is scanned once without building the FSM; its final state is
+    the remainder itself. An empty input leaves the FSM in its initial
+    state, remainder 0.
+
+    Args:
+        input_string (str): The input string to process.
+        n (int): The modulus value.
+        alphabet (Set[str]): The set of valid input symbols.
+
+    Returns:
+        Tuple[int, bool]: The remainder and whether its state is accepting.
+    """
+    if not input_string:
+        if n <= 0:
+            raise ValueError("Modulus must be positive.")
+        if not alphabet:
+            raise ValueError("Alphabet must not be empty.")
+        remainder = 0
+    else:
+        remainder = mod_n_remainder_custom_alphabet(input_string, n, alphabet)
+
+    # Every state of the mod-n FSM is final (build_mod_n_fsm uses final_states = states),
+    # so any input made of valid symbols is accepted
+    return remainder, True
 
 def mod_n_accepts(input_string: str, n: int, alphabet: Set[str]) -> bool:
     """Returns True if the FSM ends in an accepting state."""
-    fsm = build_mod_n_fsm(n, alphabet)
-    fsm.process(input_string)
-    return fsm.is_accepting()
\ No newline at end of file
+    return mod_n_compute(input_string, n, alphabet)[1]
\ No newline at end of file
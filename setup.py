@@ -1,4 +1,23 @@
-from setuptools import setup, find_packages
+import os
+from setuptools import setup, find_packages, Extension
+
+# The C scan is optional: it is compiled from _scan.pyx when Cython is available,
+# otherwise from the generated _scan.c shipped in the sdist, and skipped when
+# neither exists. optional=True turns a compiler failure into a warning, leaving
+# the pure-Python implementation.
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    cythonize = None
+
+if cythonize is not None and os.path.exists("fsm_mod_n/_scan.pyx"):
+    ext_modules = cythonize(["fsm_mod_n/_scan.pyx"])
+elif os.path.exists("fsm_mod_n/_scan.c"):
+    ext_modules = [Extension("fsm_mod_n._scan", ["fsm_mod_n/_scan.c"])]
+else:
+    ext_modules = []
+for ext in ext_modules:
+    ext.optional = True  # cythonize does not carry Extension(optional=...) over
 
 setup(
     name="fsm_mod_n",
@@ -7,6 +26,11 @@ setup(
     author="Aman Singh",
     author_email="amansingh940330@gmail.com",
     packages=find_packages(),
+    ext_modules=ext_modules,
+    extras_require={
+        "fast": ["numpy"],
+        "jit": ["numpy", "numba"]
+    },
     entry_points={
         "console_scripts": [
             "fsm-cli = fsm_mod_n.cli:main"
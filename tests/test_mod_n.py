@@ -1,16 +1,52 @@
+import importlib
+import os
+import sys
+import tempfile
 import unittest
 import logging
+from contextlib import ExitStack, contextmanager
+from unittest import mock
+from fsm_mod_n import mod_n
 from fsm_mod_n.mod_n import (
     mod_n_remainder,
     mod_n_remainder_custom_alphabet,
+    mod_n_remainder_batch,
+    mod_n_compute,
     mod_n_accepts,
     build_mod_n_fsm
 )
+from fsm_mod_n.direct import compute_remainder_direct
 
 # Set up logging for tests
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+@contextmanager
+def _extension_hidden():
+    """Reloads fsm_mod_n.mod_n as if _scan.pyx had not been built, restoring it on exit."""
+    # Reloading in place (not a copy under another name) keeps Numba's on-disk cache consistent
+    saved = sys.modules.get("fsm_mod_n._scan")
+    sys.modules["fsm_mod_n._scan"] = None
+    try:
+        yield importlib.reload(mod_n)
+    finally:
+        if saved is None:
+            del sys.modules["fsm_mod_n._scan"]
+        else:
+            sys.modules["fsm_mod_n._scan"] = saved
+        importlib.reload(mod_n)
+
+def _scan_paths():
+    """Yields (description, module) for every remainder path, disabling faster ones via patching."""
+    for name, hide_extension in (("default", False), ("no C extension", True)):
+        with ExitStack() as reloaded:
+            module = reloaded.enter_context(_extension_hidden()) if hide_extension else mod_n
+            for disabled in ((), ("_c_scan",), ("_c_scan", "_jit_scan"), ("_c_scan", "_jit_scan", "np")):
+                with ExitStack() as stack:
+                    for attr in disabled:
+                        stack.enter_context(mock.patch.object(module, attr, None))
+                    yield f"{name}, disabled={disabled}", module
+
 class TestModNFSM(unittest.TestCase):
     """
     Unit test class for testing mod-N FSM functionality using both binary and custom alphabets.
@@ -50,6 +86,27 @@ class TestModNFSM(unittest.TestCase):
         self.assertTrue(mod_n_accepts('1111', 3, {'0', '1'}))
         self.assertTrue(mod_n_accepts('1101', 3, {'0', '1'}))
 
+    def test_mod_n_compute(self):
+        """mod_n_compute returns the remainder and acceptance from a single scan."""
+        self.assertEqual(mod_n_compute("1101", 3, {'0', '1'}), (1, True))
+        self.assertEqual(mod_n_compute("BCA", 7, {'A', 'B', 'C'}), (1, True))
+        with self.assertRaises(ValueError):
+            mod_n_compute("12", 3, {'0', '1'})
+
+    def test_accepts_with_huge_modulus(self):
+        """Acceptance is decided without building the n-by-k transition table."""
+        self.assertEqual(mod_n_compute("1101", 10 ** 12, {'0', '1'}), (13, True))
+        self.assertTrue(mod_n_accepts("1", 10 ** 12, {'0', '1'}))
+
+    def test_accepts_empty_input(self):
+        """An empty input stays in the initial state S0, which is accepting like every mod-n state."""
+        self.assertEqual(mod_n_compute("", 3, {'0', '1'}), (0, True))
+        self.assertTrue(mod_n_accepts("", 3, {'0', '1'}))
+        fsm = build_mod_n_fsm(3, {'0', '1'})
+        self.assertEqual(fsm.final_states, fsm.states)
+        with self.assertRaises(ValueError):
+            mod_n_accepts("", 0, {'0', '1'})
+
     def test_custom_alphabet_abc_mod_5(self):
         """Test custom alphabet mapping: ABC = 5, 5 % 5 = 0."""
         self.assertEqual(mod_n_remainder_custom_alphabet('ABC', 5, {'A', 'B', 'C'}), 0)
@@ -99,6 +156,16 @@ class TestModNFSM(unittest.TestCase):
         with self.assertRaises(ValueError):
             mod_n_remainder_custom_alphabet("10A1", 3, {"0", "1"})
 
+    def test_invalid_character_detected_during_scan(self):
+        """Invalid characters are rejected wherever they appear, on every evaluation path."""
+        with self.assertRaises(ValueError):
+            mod_n_remainder("1" * 2000 + "2", 7)
+        with self.assertRaises(ValueError):
+            mod_n_remainder("10\u20ac1", 3)
+        with self.assertRaises(ValueError):
+            mod_n_remainder_custom_alphabet("\u03b1\u03b2x", 3, {"\u03b1", "\u03b2"})
+        self.assertEqual(mod_n_remainder_custom_alphabet("\u03b2\u03b1", 3, {"\u03b1", "\u03b2"}), 2)
+
     def test_empty_string(self):
         """
         Ensure ValueError is raised for an empty input string.
@@ -114,6 +181,71 @@ class TestModNFSM(unittest.TestCase):
         long_input = "1" * 1000
         self.assertIsInstance(mod_n_remainder(long_input, 5), int)
     
+    def test_long_input_matches_int(self):
+        """Long inputs match Python's int() on whichever scan path is active by default."""
+        long_input = "1101001" * 300
+        for n in (2, 3, 7, 1000, 65537):
+            self.assertEqual(mod_n_remainder(long_input, n), int(long_input, 2) % n)
+        self.assertEqual(
+            mod_n_remainder_custom_alphabet("BCA" * 400, 11, {"A", "B", "C"}),
+            int("120" * 400, 3) % 11
+        )
+
+    def test_every_scan_path_matches_int(self):
+        """The C, Numba, NumPy and pure-Python scans all agree with Python's int()."""
+        long_input = "1101001" * 300
+        for path, module in _scan_paths():
+            with self.subTest(path=path):
+                for n in (2, 3, 7, 1000, 65537, 2 ** 31 - 1):
+                    self.assertEqual(module.mod_n_remainder(long_input, n), int(long_input, 2) % n)
+                self.assertEqual(
+                    module.mod_n_remainder_custom_alphabet("BCA" * 400, 11, {"A", "B", "C"}),
+                    int("120" * 400, 3) % 11
+                )
+                with self.assertRaises(ValueError):
+                    module.mod_n_remainder(long_input + "2", 7)
+
+    def test_pure_python_scan_matches_int(self):
+        """The multiply-table loop (k <= n <= 2**16) and the % fallback agree with Python's int()."""
+        decimal = "9081726354" * 60
+        digits = set("0123456789")
+        with mock.patch.object(mod_n, "_c_scan", None), mock.patch.object(mod_n, "np", None):
+            for n in (3, 7, 10, 11, 97, 1 << 16, (1 << 16) + 1, 10 ** 6 + 3):
+                with self.subTest(n=n), mock.patch.object(
+                    mod_n, "_multiply_table", wraps=mod_n._multiply_table
+                ) as multiply_table:
+                    self.assertEqual(mod_n_remainder_custom_alphabet(decimal, n, digits), int(decimal) % n)
+                    self.assertEqual(multiply_table.called, 10 <= n <= 1 << 16)
+
+    def test_large_modulus_matches_int(self):
+        """Large moduli need no n-by-k transition table."""
+        binary = "1011" * 50
+        for n in (255, 256, 1000, 65537, 10 ** 12 + 39):
+            self.assertEqual(mod_n_remainder(binary, n), int(binary, 2) % n)
+
+    def test_remainder_batch(self):
+        """Batch results match per-string remainders, including large (parallel) batches."""
+        inputs = ["ABC", "BCA", "CCCC", "A"]
+        self.assertEqual(
+            mod_n_remainder_batch(inputs, 7, {"A", "B", "C"}),
+            [mod_n_remainder_custom_alphabet(s, 7, {"A", "B", "C"}) for s in inputs]
+        )
+        large = ["10" * 5000 + str(i % 2) for i in range(20)]
+        self.assertEqual(mod_n_remainder_batch(large, 97, {"0", "1"}), [int(s, 2) % 97 for s in large])
+        with self.assertRaises(ValueError):
+            mod_n_remainder_batch(["101", "1x1"], 3, {"0", "1"})
+
+    def test_compute_remainder_direct(self):
+        """The CLI's direct path agrees with the FSM-backed API, errors included."""
+        for input_string, n, alphabet in [("1101", 3, {"0", "1"}), ("BCA", 7, {"A", "B", "C"}), ("ABD", 3, {"D", "B", "A"})]:
+            self.assertEqual(
+                compute_remainder_direct(input_string, n, alphabet),
+                mod_n_remainder_custom_alphabet(input_string, n, alphabet)
+            )
+        for input_string, n in [("", 3), ("10a1", 3), ("101", 0)]:
+            with self.assertRaises(ValueError):
+                compute_remainder_direct(input_string, n, {"0", "1"})
+
     def test_fsm_is_accepting(self):
         fsm = build_mod_n_fsm(2, {'0', '1'})
         fsm.process('10')  # Binary 2 -> remainder 0
@@ -130,16 +262,101 @@ class TestModNFSM(unittest.TestCase):
         """FSM with single-symbol alphabet always returns 0."""
         self.assertEqual(mod_n_remainder_custom_alphabet("AAAA", 4, {'A'}), 0)
 
+    def test_always_zero_cases_still_validate(self):
+        """Modulus 1 and one-symbol alphabets skip the scan but still reject invalid characters."""
+        with self.assertRaises(ValueError):
+            mod_n_remainder("1121", 1)
+        with self.assertRaises(ValueError):
+            mod_n_remainder_custom_alphabet("AAB", 4, {'A'})
+        with self.assertRaises(ValueError):
+            mod_n_remainder_custom_alphabet("\u03b1x", 1, {'\u03b1', '\u03b2'})
+        self.assertEqual(mod_n_remainder_custom_alphabet("\u03b2\u03b1", 1, {'\u03b1', '\u03b2'}), 0)
+
     def test_special_character_alphabet(self):
         """FSM supports special symbols like '#' as valid alphabet."""
         self.assertEqual(mod_n_remainder_custom_alphabet("##", 2, {'#'}), 0)
 
     def test_transition_table_completeness(self):
-        """Ensure FSM transition table includes all states and symbols."""
+        """Ensure FSM transition table has a valid entry for every state and symbol."""
         fsm = build_mod_n_fsm(3, {'A', 'B'})
-        for state in fsm.states:
-            self.assertIn(state, fsm.transition_function)
-            self.assertSetEqual(set(fsm.transition_function[state].keys()), {'A', 'B'})
+        self.assertEqual(len(fsm.transition_function), len(fsm.states) * 2)
+        for next_state in fsm.transition_function:
+            self.assertIn(next_state, fsm.states)
+
+    def test_transition_table_width(self):
+        """Small moduli use a bytes table, larger ones an int array; both process correctly."""
+        small = build_mod_n_fsm(256, {'0', '1'})
+        large = build_mod_n_fsm(1000, {'0', '1'})
+        self.assertIsInstance(small.transition_function, bytes)
+        self.assertNotIsInstance(large.transition_function, bytes)
+        self.assertEqual(small.process("1" * 20), (2 ** 20 - 1) % 256)
+        self.assertEqual(large.process("1" * 20), (2 ** 20 - 1) % 1000)
+
+    def test_cached_fsm_instances_are_independent(self):
+        """Repeated builds share transition tables but not processing state."""
+        first = build_mod_n_fsm(3, {'0', '1'})
+        second = build_mod_n_fsm(3, {'1', '0'})
+        self.assertIsNot(first, second)
+        self.assertIs(first.transition_function, second.transition_function)
+        self.assertIs(first._sym_to_idx, second._sym_to_idx)
+        first.process("1101")
+        first.final_states = {0}
+        self.assertEqual(second.current_state, 0)
+        self.assertTrue(mod_n_accepts("1101", 3, {'0', '1'}))
+
+    def test_large_transition_tables_are_not_cached(self):
+        """Tables above the cache limit are rebuilt per FSM, so dropping the FSM frees them."""
+        with mock.patch.object(mod_n, "_TABLE_CACHE_MAX_ENTRIES", 4):
+            first = build_mod_n_fsm(5, {'0', '1'})
+            second = build_mod_n_fsm(5, {'0', '1'})
+        self.assertIsNot(first.transition_function, second.transition_function)
+        self.assertEqual(first.transition_function, second.transition_function)
+        self.assertIsNot(first.states, second.states)
+
+    def test_fsm_process_rejects_invalid_symbols(self):
+        """FSM.process raises ValueError for symbols outside the alphabet, including non-Latin-1 ones."""
+        fsm = build_mod_n_fsm(3, {'0', '1'})
+        for bad_input in ("1021", "10\u20ac1"):
+            with self.assertRaises(ValueError):
+                fsm.process(bad_input)
+        self.assertEqual(fsm.process("1101"), 1)
+
+    def test_enable_file_logging(self):
+        """File logging is opt-in and writes FSM activity to the given path."""
+        from fsm_mod_n.fsm import enable_file_logging, disable_file_logging
+        package_logger = logging.getLogger("fsm_mod_n")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "fsm.log")
+            handler = enable_file_logging(path)
+            try:
+                with mock.patch.object(package_logger, "level", logging.INFO):
+                    build_mod_n_fsm(3, {'0', '1'}).process("1101")
+                # Buffered records are written out when process() completes
+                with open(path) as log_file:
+                    self.assertIn("Final state: S1", log_file.read())
+            finally:
+                disable_file_logging(handler)
+
+    def test_log_messages_use_state_names(self):
+        """Mod-n FSM log lines name states 'S<i>' and log the state count, not the state set."""
+        with self.assertLogs("fsm_mod_n", level="INFO") as logs:
+            build_mod_n_fsm(3, {'0', '1'}).process("1101")
+        self.assertIn("FSM initialized with 3 states", logs.output[0])
+        self.assertIn("initial_state=S0", logs.output[0])
+        self.assertIn("Final state: S1", logs.output[-1])
+
+    def test_file_logging_leaves_logger_configuration_alone(self):
+        """Enabling file logging neither changes the logger's level nor leaves handlers behind."""
+        from fsm_mod_n.fsm import enable_file_logging, disable_file_logging
+        package_logger = logging.getLogger("fsm_mod_n")
+        previous = (package_logger.level, package_logger.propagate, list(package_logger.handlers))
+        with tempfile.TemporaryDirectory() as tmp:
+            handler = enable_file_logging(os.path.join(tmp, "fsm.log"), level=logging.DEBUG)
+            try:
+                self.assertEqual((package_logger.level, package_logger.propagate), previous[:2])
+            finally:
+                disable_file_logging(handler)
+        self.assertEqual((package_logger.level, package_logger.propagate, package_logger.handlers), previous)
 
     def test_invalid_fsm_construction(self):
         """FSM constructor should fail for bad initial/final states."""
@@ -155,9 +372,10 @@ class TestModNFSM(unittest.TestCase):
     def test_non_accepting_custom_fsm(self):
         """Override FSM to have non-accepting state and test rejection."""
         fsm = build_mod_n_fsm(3, {'0', '1'})
-        fsm.final_states = {'S0'}
+        fsm.final_states = {0}
         fsm.process("1101")  # 13 % 3 = 1 → S1
         self.assertFalse(fsm.is_accepting())
+        self.assertEqual(fsm.current_state_name, 'S1')
 
 # Run the test suite when this file is executed directly
 if __name__ == "__main__":